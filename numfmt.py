@@ -0,0 +1,47 @@
+"""한국식 큰수(만/억/조/경) 표기 포맷터.
+
+Streamlit은 rerun마다 streamlit_app.py를 다시 실행하지만, import된 모듈은 sys.modules에
+남으므로 포맷터 lru_cache가 프로세스당 한 번만 만들어지고 유지됨.
+"""
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Callable, Tuple
+
+UNITS = ("", "만", "억", "조", "경")
+_THRESHOLDS = (10_000, 10**8, 10**12, 10**16)
+_DIVISORS = (1, 10_000, 10**8, 10**12, 10**16)
+
+
+def scale(iv: int) -> Tuple[float, int]:
+    """정수를 만/억/조/경 단위로 나눈 값과 단위 인덱스 반환."""
+    idx = bisect_right(_THRESHOLDS, abs(iv))
+    return iv / _DIVISORS[idx], idx
+
+
+@lru_cache(maxsize=None)
+def make_formatter(unit: str) -> Callable[[str], str]:
+    """단위(예: 명, 개, 회)를 미리 붙여둔 전용 포맷터 생성(단위별로 한 번만 만들어짐)."""
+    small_fmt = "{:,}" + unit
+    suffixes = tuple(u + unit for u in UNITS)
+
+    @lru_cache(maxsize=4096)
+    def fmt(n: str) -> str:
+        try:
+            iv = int(n)
+        except Exception:
+            # 이미 포맷된 문자열이면 그대로 반환
+            return str(n)
+
+        # 반복 나눗셈 대신 정수 임계값 비교로 단위 인덱스 결정
+        value, idx = scale(iv)
+        if idx == 0:
+            return small_fmt.format(iv)
+        # 소수 첫째자리까지, .0은 제거
+        return f"{value:.1f}".rstrip("0").rstrip(".") + suffixes[idx]
+
+    return fmt
+
+
+# 렌더링에서 쓰는 단위별 포맷터(결과는 n별로 캐시됨)
+format_views, format_count, format_subs = map(make_formatter, ("회", "개", "명"))
+
@@ -1,10 +1,22 @@
+import gzip
+import hashlib
+import hmac
 import os
+import sqlite3
+import threading
 import time
-from typing import Dict, Any, List, Optional, Union
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple, Union
 
+import orjson
 import requests
 import streamlit as st
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from numfmt import format_count, format_subs, format_views
 
 
 # -----------------------------
@@ -30,77 +42,294 @@ except ValueError:
 # 로그인 정보(secrets 우선, 환경 변수 폴백)
 AUTH_USERNAME = _get_secret("AUTH_USERNAME", os.getenv("AUTH_USERNAME", "admin"))
 AUTH_PASSWORD = _get_secret("AUTH_PASSWORD", os.getenv("AUTH_PASSWORD", "changeme"))
+# 상수 시간 비교용 바이트(매 제출마다 str() 변환하지 않도록 미리 계산)
+_AUTH_USER_BYTES = str(AUTH_USERNAME or "").encode("utf-8")
+_AUTH_PW_BYTES = str(AUTH_PASSWORD or "").encode("utf-8")
 
 YOUTUBE_VIDEOS_ENDPOINT = "https://www.googleapis.com/youtube/v3/videos"
 YOUTUBE_CHANNELS_ENDPOINT = "https://www.googleapis.com/youtube/v3/channels"
 
+# 지역 선택 옵션(rerun마다 다시 만들지 않도록 모듈 로드 시 한 번만 계산)
+_REGION_PRESETS = (
+    ("KR", "대한민국"),
+    ("US", "미국"),
+    ("JP", "일본"),
+    ("GB", "영국"),
+    ("DE", "독일"),
+    ("FR", "프랑스"),
+    ("IN", "인도"),
+    ("ID", "인도네시아"),
+    ("VN", "베트남"),
+    ("BR", "브라질"),
+    ("CA", "캐나다"),
+    ("AU", "호주"),
+)
+_CUSTOM_REGION_OPTION = "직접 입력(Custom)..."
+_DISPLAY_TO_CODE = {f"{name} ({code})": code for code, name in _REGION_PRESETS}  # "대한민국 (KR)" -> "KR"
+_DISPLAY_OPTIONS = tuple(_DISPLAY_TO_CODE) + (_CUSTOM_REGION_OPTION,)
+_CODE_LIST = tuple(code for code, _ in _REGION_PRESETS)
+_DEFAULT_SLIDER_VALUE = min(DEFAULT_MAX_RESULTS, 30)
+_DEFAULT_REGION_INDEX = _CODE_LIST.index(DEFAULT_REGION) if DEFAULT_REGION in _CODE_LIST else 0
+
+# videos/channels 모두 같은 호스트이므로 세션 하나로 커넥션(keep-alive) 재사용
+# (스크립트는 rerun마다 다시 실행되므로 cache_resource로 프로세스당 하나만 유지.
+#  모듈 로드 시 호출되므로 show_spinner=False: 스피너 요소가 set_page_config보다 먼저 나가지 않게)
+@st.cache_resource(show_spinner=False)
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update({"Accept-Encoding": "gzip", "User-Agent": "vibecoding/1.0"})
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            # raise_on_status=False: 재시도 소진 시 RetryError 대신 응답을 돌려줘 raise_for_status()가 HTTPError로 처리
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
 
-def human_readable_views(n: str) -> str:
-    """조회수(문자열 또는 숫자)를 보기 좋게 포맷팅(만/억/조 단위)."""
-    return human_readable_number(n, "회")
 
+_SESSION = _create_session()
 
-def human_readable_number(n: str, unit: str) -> str:
-    """한국식 큰수 표기(만/억/조)로 간략 표시 + 단위(예: 명, 개, 회).
-    예) 1,730,000 -> 173만명, 27,700,000 -> 277만명
-    """
+# 프로세스/세션 간 공유되는 디스크 캐시(SQLite). 엔드포인트별 최대 데이터 나이(초)
+_DISK_CACHE_PATH = os.path.join(".cache", "youtube.sqlite3")
+VIDEOS_CACHE_TTL = 300  # 인기 목록은 자주 바뀜
+CHANNELS_CACHE_TTL = 3600  # 구독자 수는 천천히 바뀜
+# 캐시가 디스크 → st.cache_data → (채널만) 세션 캐시로 겹치므로, 각 층 TTL의 합이 위 값을 넘지 않게 나눔
+_MEMORY_CACHE_TTL = 60
+_SESSION_CHANNELS_TTL = CHANNELS_CACHE_TTL // 2
+_VIDEOS_DISK_TTL = VIDEOS_CACHE_TTL - _MEMORY_CACHE_TTL
+_CHANNELS_DISK_TTL = CHANNELS_CACHE_TTL - _MEMORY_CACHE_TTL - _SESSION_CHANNELS_TTL
+
+
+@st.cache_resource(show_spinner=False)
+def _init_disk_cache() -> bool:
+    """캐시 디렉터리와 테이블을 프로세스당 한 번만 생성(실패 시 예외, 다음 호출에서 재시도)."""
+    os.makedirs(os.path.dirname(_DISK_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(_DISK_CACHE_PATH, timeout=5)
     try:
-        value = float(int(n))
-    except Exception:
-        # 이미 포맷된 문자열이면 그대로 반환
-        return str(n)
-
-    units = ["", "만", "억", "조", "경"]
-    idx = 0
-    while abs(value) >= 10000 and idx < len(units) - 1:
-        value /= 10000.0
-        idx += 1
-
-    if idx == 0:
-        return f"{int(value):,}{unit}"
-    # 소수 첫째자리까지, .0은 제거
-    compact = f"{value:.1f}".rstrip("0").rstrip(".")
-    return f"{compact}{units[idx]}{unit}"
-
-
-@st.cache_data(ttl=300, show_spinner=False)
-def fetch_popular_videos(api_key: str, region_code: str, max_results: int) -> Dict[str, Any]:
-    """YouTube Data API로 인기 동영상 목록 가져오기."""
-    params = {
+        with conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, expires REAL, body BLOB)")
+    finally:
+        conn.close()
+    return True
+
+
+def _disk_cache_connect() -> sqlite3.Connection:
+    _init_disk_cache()
+    return sqlite3.connect(_DISK_CACHE_PATH, timeout=5)
+
+
+def _disk_cache_get(key: str) -> Optional[bytes]:
+    """만료되지 않은 캐시 본문(압축 해제된 bytes) 반환, 없으면 None."""
+    try:
+        conn = _disk_cache_connect()
+        try:
+            row = conn.execute("SELECT expires, body FROM cache WHERE key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):  # 읽기 전용 디렉터리 등도 캐시 실패로 보고 무시
+        return None
+    if row is None or row[0] < time.time():
+        return None
+    try:
+        return gzip.decompress(row[1])
+    except (OSError, EOFError, zlib.error):
+        return None  # 손상/잘린 항목은 미스로 처리하고 API에서 다시 받음
+
+
+def _disk_cache_delete(key: str) -> None:
+    """해당 키의 캐시 항목 삭제(새로고침용)."""
+    try:
+        conn = _disk_cache_connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def _disk_cache_set(key: str, body: bytes, ttl: int) -> None:
+    """gzip 압축해 저장하고, 만료된 항목은 함께 정리."""
+    now = time.time()
+    try:
+        conn = _disk_cache_connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM cache WHERE expires < ?", (now,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, expires, body) VALUES (?, ?, ?)",
+                    (key, now + ttl, gzip.compress(body)),
+                )
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        pass  # 캐시 실패는 무시(API 응답은 그대로 사용)
+
+
+# 캐시 키별 마지막 (ETag, 본문). TTL이 지나도 If-None-Match로 304를 받으면 본문을 재사용
+_ETAG_CACHE_MAX = 256
+
+
+@st.cache_resource(show_spinner=False)
+def _create_etag_cache() -> Tuple[Dict[str, Tuple[str, bytes]], threading.Lock]:
+    # 여러 실행기 스레드가 동시에 갱신하므로 조회/축출/삽입은 잠금 안에서 수행
+    return {}, threading.Lock()
+
+
+_ETAG_CACHE, _ETAG_LOCK = _create_etag_cache()
+
+
+def _cache_key(url: str, params: Dict[str, Any]) -> str:
+    sorted_params = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+    return hashlib.blake2b(f"{url}?{sorted_params}".encode("utf-8")).hexdigest()
+
+
+def _cached_get_json(url: str, params: Dict[str, Any], ttl: int) -> Dict[str, Any]:
+    """디스크 캐시를 먼저 확인하고, 없으면 API 호출 후 저장.
+    이전 응답의 ETag가 있으면 조건부 요청을 보내 304(변경 없음)일 때 본문 전송을 생략.
+    """
+    key = _cache_key(url, params)
+    body = _disk_cache_get(key)
+    if body is None:
+        with _ETAG_LOCK:
+            cached = _ETAG_CACHE.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        resp = _SESSION.get(url, params=params, headers=headers, timeout=15)
+        resp.raise_for_status()  # HTTP 오류 시 예외
+        if resp.status_code == 304 and cached:
+            body = cached[1]
+        else:
+            body = resp.content
+            etag = resp.headers.get("ETag")
+            if etag:
+                with _ETAG_LOCK:
+                    _ETAG_CACHE.pop(key, None)
+                    if len(_ETAG_CACHE) >= _ETAG_CACHE_MAX:
+                        _ETAG_CACHE.pop(next(iter(_ETAG_CACHE)))  # 가장 오래된 항목 제거
+                    _ETAG_CACHE[key] = (etag, body)
+        _disk_cache_set(key, body, ttl)
+    return orjson.loads(body)  # stdlib json보다 빠른 C 확장 파서
+
+
+# 채널 통계 등 부가 요청을 렌더링과 병렬로 처리하기 위한 스레드 풀(프로세스당 하나)
+@st.cache_resource(show_spinner=False)
+def _create_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=4)
+
+
+# 채널 ID 50개 단위 분할 요청 전용 풀. fetch_channel_statistics는 _EXECUTOR 위에서 실행되므로
+# 같은 풀에 하위 작업을 넣고 기다리면 워커가 모두 막혀 교착될 수 있음
+@st.cache_resource(show_spinner=False)
+def _create_chunk_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=4)
+
+
+_EXECUTOR = _create_executor()
+_CHUNK_EXECUTOR = _create_chunk_executor()
+CHANNELS_RESULT_TIMEOUT = 30  # 채널 통계 응답을 기다리는 최대 시간(초)
+
+
+def _videos_params(region_code: str, max_results: int) -> Dict[str, Any]:
+    return {
         "part": "snippet,statistics",
         "chart": "mostPopular",
         "regionCode": region_code,
         "maxResults": max_results,
-        "key": api_key,
+        # 부분 응답: 렌더링에 쓰는 필드만 요청해 페이로드 축소
+        "fields": "items(id,snippet(title,channelTitle,channelId,thumbnails(default/url,medium/url,high/url)),"
+                  "statistics(viewCount,likeCount,commentCount))",
+        "key": YOUTUBE_API_KEY,
     }
-    resp = requests.get(YOUTUBE_VIDEOS_ENDPOINT, params=params, timeout=15)
-    resp.raise_for_status()  # HTTP 오류 시 예외
-    return resp.json()
 
 
-@st.cache_data(ttl=300, show_spinner=False)
-def fetch_channel_statistics(api_key: str, channel_ids: List[str]) -> Dict[str, Any]:
-    """채널 구독자 수 등 통계를 한번에 조회(최대 50개).
-    반환: {channelId: statistics(dict)}
+@st.cache_data(ttl=_MEMORY_CACHE_TTL, show_spinner=False)
+def fetch_popular_videos(region_code: str, max_results: int) -> Dict[str, Any]:
+    """YouTube Data API로 인기 동영상 목록 가져오기.
+    API 키는 모듈 상수를 직접 사용해 캐시 키 해싱 대상에서 제외.
     """
-    if not channel_ids:
-        return {}
-    unique_ids = list(dict.fromkeys([cid for cid in channel_ids if cid]))  # 중복 제거, 순서 유지
-    params = {
+    return _cached_get_json(YOUTUBE_VIDEOS_ENDPOINT, _videos_params(region_code, max_results), _VIDEOS_DISK_TTL)
+
+
+def refresh_popular_videos(region_code: str, max_results: int):
+    """해당 (지역, 개수) 항목만 메모리/디스크 캐시에서 제거해 다음 조회 때 API를 다시 호출."""
+    fetch_popular_videos.clear(region_code, max_results)
+    _disk_cache_delete(_cache_key(YOUTUBE_VIDEOS_ENDPOINT, _videos_params(region_code, max_results)))
+
+
+def _channels_params(ids: List[str]) -> Dict[str, Any]:
+    return {
         "part": "statistics",
-        "id": ",".join(unique_ids[:50]),  # videos API 최대 50과 동일 범위
-        "key": api_key,
+        "id": ",".join(ids),
+        "fields": "items(id,statistics(subscriberCount))",
+        "key": YOUTUBE_API_KEY,
     }
-    resp = requests.get(YOUTUBE_CHANNELS_ENDPOINT, params=params, timeout=15)
-    resp.raise_for_status()
-    data = resp.json()
+
+
+def _channel_chunks(channel_ids: Tuple[str, ...]) -> List[List[str]]:
+    """중복/빈값을 제거(순서 유지)하고 API 한도인 50개 단위로 분할."""
+    unique_ids = list(dict.fromkeys([cid for cid in channel_ids if cid]))
+    return [unique_ids[i:i + 50] for i in range(0, len(unique_ids), 50)]
+
+
+def _fetch_channel_chunk(ids: List[str]) -> Dict[str, Any]:
+    """채널 ID 최대 50개 단위로 channels API 호출."""
+    return _cached_get_json(YOUTUBE_CHANNELS_ENDPOINT, _channels_params(ids), _CHANNELS_DISK_TTL)
+
+
+@st.cache_data(ttl=_MEMORY_CACHE_TTL, show_spinner=False)
+def fetch_channel_statistics(channel_ids: Tuple[str, ...]) -> Dict[str, Any]:
+    """채널 구독자 수 등 통계를 조회(API 한도인 50개 단위로 나눠 병렬 요청).
+    channel_ids는 해싱이 가벼운 튜플로 전달.
+    반환: {channelId: statistics(dict)}
+    """
+    chunks = _channel_chunks(channel_ids)
+    if not chunks:
+        return {}
+    if len(chunks) == 1:
+        # 대부분의 경우(최대 50개) 풀을 거치지 않고 바로 요청
+        results = [_fetch_channel_chunk(chunks[0])]
+    else:
+        results = _CHUNK_EXECUTOR.map(_fetch_channel_chunk, chunks)
     out: Dict[str, Any] = {}
-    for item in data.get("items", []):
-        cid = item.get("id")
-        out[cid] = item.get("statistics", {})
+    for data in results:
+        for item in data.get("items", []):
+            cid = item.get("id")
+            out[cid] = item.get("statistics", {})
     return out
 
 
+def refresh_channel_statistics(channel_ids: Tuple[str, ...]):
+    """이 채널 ID 튜플의 메모리/디스크 캐시 항목을 제거해 다음 조회 때 API를 다시 호출."""
+    fetch_channel_statistics.clear(channel_ids)
+    for ids in _channel_chunks(channel_ids):
+        _disk_cache_delete(_cache_key(YOUTUBE_CHANNELS_ENDPOINT, _channels_params(ids)))
+
+
+def _warm_default_view():
+    """기본 지역/개수의 인기 동영상과 채널 통계를 미리 조회해 캐시를 채움."""
+    # 사이드바가 처음 선택하는 값과 동일하게(DEFAULT_REGION이 프리셋에 없으면 첫 항목)
+    # st.cache_data는 전달된 인자만으로 키를 만들므로 main()과 똑같이 위치 인자로 전달
+    data = fetch_popular_videos(_CODE_LIST[_DEFAULT_REGION_INDEX], _DEFAULT_SLIDER_VALUE)
+    channel_ids = [it.get("snippet", {}).get("channelId", "") for it in data.get("items", [])]
+    # main()이 새 세션에서 넘기는 인자(중복/빈값 제거, 순서 유지)와 같아야 같은 캐시 항목을 사용
+    fetch_channel_statistics(tuple(cid for cid in dict.fromkeys(channel_ids) if cid))
+
+
+@st.cache_resource
+def _start_warmup():
+    """프로세스당 한 번만 백그라운드 워밍업 시작."""
+    return _EXECUTOR.submit(_warm_default_view)
+
+
 def validate_env() -> bool:
     if not YOUTUBE_API_KEY:
         st.error("YOUTUBE_API_KEY가 설정되지 않았습니다. 배포 시에는 .streamlit/secrets.toml에 설정하고, 로컬 개발 시에는 .env도 사용할 수 있습니다.")
@@ -144,7 +373,8 @@ def ensure_login() -> bool:
         submitted = st.form_submit_button("로그인")
 
         if submitted:
-            if username == str(AUTH_USERNAME) and password == str(AUTH_PASSWORD):
+            # 타이밍 공격 방지: compare_digest + 단락 평가 없는 `&`
+            if hmac.compare_digest(username.encode("utf-8"), _AUTH_USER_BYTES) & hmac.compare_digest(password.encode("utf-8"), _AUTH_PW_BYTES):
                 st.session_state.is_authed = True
                 st.success("로그인 성공")
                 st.rerun()
@@ -153,43 +383,80 @@ def ensure_login() -> bool:
     return False
 
 
-def render_video_item(item: Dict[str, Any], channel_stats_map: Dict[str, Any]):
-    vid = item.get("id", "")
-    snippet = item.get("snippet", {})
-    stats = item.get("statistics", {})
+class Row(NamedTuple):
+    """렌더링에 필요한 값만 미리 계산해둔 한 줄(동영상 1개) 데이터."""
+    vid: str
+    title: str
+    channel: str
+    subs_text: str
+    thumb_url: Optional[str]
+    views: str
+    likes: str
+    comments: str
+    video_url: str
+
+
+_THUMB_SIZES = ("medium", "high", "default")
 
-    title = snippet.get("title", "(제목 없음)")
-    channel = snippet.get("channelTitle", "(채널 정보 없음)")
-    channel_id = snippet.get("channelId", "")
-    thumbs = snippet.get("thumbnails", {})
-    thumb_url = (
-        thumbs.get("medium", {}).get("url")
-        or thumbs.get("high", {}).get("url")
-        or thumbs.get("default", {}).get("url")
-    )
-    views = human_readable_number(stats.get("viewCount", "0"), "회")
-    likes = human_readable_number(stats.get("likeCount", "0"), "개") if stats.get("likeCount") is not None else "비공개"
-    comments = human_readable_number(stats.get("commentCount", "0"), "개") if stats.get("commentCount") is not None else "비공개"
-    video_url = f"https://www.youtube.com/watch?v={vid}"
-
-    # 채널 구독자 수 조회
-    subs_text = "비공개"
-    if channel_id and channel_id in channel_stats_map:
-        ch_stats = channel_stats_map[channel_id] or {}
-        subs = ch_stats.get("subscriberCount")
-        if subs is not None:
-            subs_text = human_readable_number(subs, "명")
 
+def build_rows(items: List[Dict[str, Any]], channel_stats_map: Optional[Dict[str, Any]]) -> List[Row]:
+    """API 응답 items를 한 번 순회하며 dict 조회/숫자 포맷팅을 모두 끝낸 Row 목록으로 변환.
+    channel_stats_map이 None이면 채널 통계를 아직 받는 중이므로 구독자 수를 로딩 표시로 채움.
+    """
+    rows: List[Row] = []
+    for item in items:
+        vid = item.get("id", "")
+        snippet = item.get("snippet", {})
+        stats = item.get("statistics", {})
+
+        channel_id = snippet.get("channelId", "")
+        thumbs = snippet.get("thumbnails", {})
+        # 1/4 폭 열(wide 레이아웃에서 약 300px)에 맞는 medium(320×180)을 우선, default(120×90)는 최후 수단
+        thumb_url = next((thumbs[k]["url"] for k in _THUMB_SIZES if k in thumbs and thumbs[k].get("url")), None)
+        likes = format_count(stats.get("likeCount", "0")) if stats.get("likeCount") is not None else "비공개"
+        comments = format_count(stats.get("commentCount", "0")) if stats.get("commentCount") is not None else "비공개"
+
+        # 채널 구독자 수 조회
+        subs_text = "불러오는 중..." if channel_stats_map is None else "비공개"
+        if channel_stats_map and channel_id and channel_id in channel_stats_map:
+            ch_stats = channel_stats_map[channel_id] or {}
+            subs = ch_stats.get("subscriberCount")
+            if subs is not None:
+                subs_text = format_subs(subs)
+
+        rows.append(Row(
+            vid=vid,
+            title=snippet.get("title", "(제목 없음)"),
+            channel=snippet.get("channelTitle", "(채널 정보 없음)"),
+            subs_text=subs_text,
+            thumb_url=thumb_url,
+            views=format_views(stats.get("viewCount", "0")),
+            likes=likes,
+            comments=comments,
+            video_url=f"https://www.youtube.com/watch?v={vid}",
+        ))
+    return rows
+
+
+def render_row(row: Row):
     left, right = st.columns([1, 3], vertical_alignment="center")
     with left:
-        if thumb_url:
-            st.image(thumb_url, use_container_width=True)
+        if row.thumb_url:
+            st.image(row.thumb_url, use_container_width=True)
         else:
             st.write("(썸네일 없음)")
     with right:
-        st.markdown(f"**[{title}]({video_url})**")
-        st.caption(f"채널: {channel} · 구독자: {subs_text}")
-        st.caption(f"조회수: {views} · 좋아요: {likes} · 댓글: {comments}")
+        st.markdown(f"**[{row.title}]({row.video_url})**")
+        st.caption(f"채널: {row.channel} · 구독자: {row.subs_text}")
+        st.caption(f"조회수: {row.views} · 좋아요: {row.likes} · 댓글: {row.comments}")
+
+
+def render_rows(placeholders: List[Any], rows: List[Row]):
+    """st.empty() 자리마다 행을 (다시) 그림."""
+    for placeholder, row in zip(placeholders, rows):
+        with placeholder.container():
+            render_row(row)
+            st.markdown("---")
 
 
 def main():
@@ -198,6 +465,7 @@ def main():
     st.caption("간단한 YouTube Data API 예제 · 지역/개수 조절 가능 · 5분 캐시")
 
     validate_env()
+    _start_warmup()  # 로그인하는 동안 기본 보기 캐시를 채움
 
     # 로그인 게이트
     if not ensure_login():
@@ -208,47 +476,35 @@ def main():
         # 로그아웃 버튼
         if st.button("로그아웃", type="secondary"):
             st.session_state.is_authed = False
+            st.session_state.pop("_ch_cache", None)
             fetch_popular_videos.clear()
             fetch_channel_statistics.clear()
             st.rerun()
-        region_presets = [
-            ("KR", "대한민국"),
-            ("US", "미국"),
-            ("JP", "일본"),
-            ("GB", "영국"),
-            ("DE", "독일"),
-            ("FR", "프랑스"),
-            ("IN", "인도"),
-            ("ID", "인도네시아"),
-            ("VN", "베트남"),
-            ("BR", "브라질"),
-            ("CA", "캐나다"),
-            ("AU", "호주"),
-        ]
-        display_options = [f"{name} ({code})" for code, name in region_presets] + ["직접 입력(Custom)..."]
-        code_list = [code for code, _ in region_presets]
-        try:
-            default_index = code_list.index(DEFAULT_REGION)
-        except ValueError:
-            default_index = 0
-        region_choice = st.selectbox("지역 선택", options=display_options, index=default_index)
-        if region_choice == "직접 입력(Custom)...":
+        region_choice = st.selectbox("지역 선택", options=_DISPLAY_OPTIONS, index=_DEFAULT_REGION_INDEX)
+        if region_choice == _CUSTOM_REGION_OPTION:
             region = st.text_input("지역 코드 직접 입력 (ISO 3166-1 Alpha-2)", value=DEFAULT_REGION)
         else:
-            # "대한민국 (KR)" 형태에서 코드 추출
-            region = region_choice.split("(")[-1].strip(")")
+            region = _DISPLAY_TO_CODE[region_choice]
 
-        max_results = st.slider("표시 개수", min_value=5, max_value=50, value=min(DEFAULT_MAX_RESULTS, 30), step=5)
+        max_results = st.slider("표시 개수", min_value=5, max_value=50, value=_DEFAULT_SLIDER_VALUE, step=5)
         st.divider()
         refresh = st.button("🔄 새로고침")
         if refresh:
-            fetch_popular_videos.clear()
-            fetch_channel_statistics.clear()
-            st.experimental_rerun()
+            # 전체 캐시를 비우지 않고 현재 보기 항목만 제거해 다른 사용자/지역 캐시는 유지
+            last_view = st.session_state.get("_view_channel_ids")
+            if last_view and last_view[0] == (region, max_results):
+                view_channel_ids = last_view[1]
+                cached_channels = st.session_state.get("_ch_cache", {})
+                for cid in view_channel_ids:
+                    cached_channels.pop(cid, None)
+                # 세션 캐시에서 뺐으므로 다음 실행은 이 튜플 그대로 조회함 -> 같은 키의 항목을 제거
+                refresh_channel_statistics(view_channel_ids)
+            refresh_popular_videos(region, max_results)
+            st.rerun()
 
     try:
         with st.spinner("인기 동영상을 불러오는 중..."):
-            data = fetch_popular_videos(YOUTUBE_API_KEY, region, max_results)
+            data = fetch_popular_videos(region, max_results)
     except requests.HTTPError as e:
         status = getattr(e.response, "status_code", "-")
         try:
@@ -271,19 +527,33 @@ def main():
         st.warning("표시할 동영상이 없습니다. 지역 코드를 변경하거나 잠시 후 새로고침해 보세요.")
         return
 
+    # 채널 통계(구독자 수)는 세션에 누적 캐시하고, 없거나 만료된 채널만 조회
+    channel_ids = [it.get("snippet", {}).get("channelId", "") for it in items]
+    now = time.time()
+    cached_channels = st.session_state.setdefault("_ch_cache", {})
+    missing = [cid for cid in dict.fromkeys(channel_ids) if cid and (cid not in cached_channels or cached_channels[cid][1] < now)]
+    # 요청을 먼저 띄워두고, 응답을 기다리는 동안 헤더를 렌더링
+    channel_future = _EXECUTOR.submit(fetch_channel_statistics, tuple(missing)) if missing else None
+    # 새로고침 시 현재 보기의 채널만 무효화할 수 있도록 기록
+    st.session_state["_view_channel_ids"] = ((region, max_results), tuple(cid for cid in dict.fromkeys(channel_ids) if cid))
+
     st.write(f"총 {len(items)}개 결과")
     st.divider()
 
-    # 채널 통계 가져오기(구독자 수)
-    channel_ids = [it.get("snippet", {}).get("channelId", "") for it in items]
-    try:
-        channel_stats_map = fetch_channel_statistics(YOUTUBE_API_KEY, channel_ids)
-    except Exception:
-        channel_stats_map = {}
-
-    for item in items:
-        render_video_item(item, channel_stats_map)
-        st.markdown("---")
+    # 행마다 자리(placeholder)를 잡아, 채널 통계를 기다리는 중이면 구독자 수 없이 먼저 그리고
+    # 응답이 오면 같은 자리를 다시 채움(이미 끝났으면 한 번만 그림)
+    placeholders = [st.empty() for _ in items]
+    if channel_future is not None:
+        if not channel_future.done():
+            render_rows(placeholders, build_rows(items, None))
+        try:
+            fresh = channel_future.result(timeout=CHANNELS_RESULT_TIMEOUT)
+        except Exception:
+            fresh = {}
+        for cid, ch_stats in fresh.items():
+            cached_channels[cid] = (ch_stats, now + _SESSION_CHANNELS_TTL)
+    channel_stats_map = {cid: cached_channels[cid][0] for cid in channel_ids if cid in cached_channels}
+    render_rows(placeholders, build_rows(items, channel_stats_map))
 
     st.caption(f"마지막 업데이트: {time.strftime('%Y-%m-%d %H:%M:%S')}")
 